@@ -1,12 +1,16 @@
 from __future__ import annotations
 
 from collections.abc import Iterable, Mapping
+from sys import intern
 from typing import Any, Dict, Iterator
 
 from .exceptions import ConfigurationError
 from .sources import ConfigSource
-from .utils import deep_merge
-from .validation import validate_config
+from .utils import _deep_merge_inplace, _fast_copy
+from .validation import _CompiledSchema, _is_trivial_schema
+
+# Sentinel for "key not present" lookups
+_MISSING = object()
 
 
 class Config(Mapping[str, Any]):
@@ -15,13 +19,25 @@ class Config(Mapping[str, Any]):
 
     Provides both mapping access (cfg["section"]["key"]) and
     attribute-style access (cfg.section.key).
+
+    The given mapping is copied unless `_copy=False` is passed for a plain
+    dict; that is only meant for callers handing over a dict that is not
+    modified afterwards. All access goes through one lookup namespace, built
+    on first use, so a Config never disagrees with itself even if such a
+    dict is changed later.
     """
 
-    def __init__(self, data: Mapping[str, Any]):
-        self._data: Dict[str, Any] = dict(data)
+    __slots__ = ("_data", "_namespace")
+
+    def __init__(self, data: Mapping[str, Any], *, _copy: bool = True):
+        if _copy or not isinstance(data, dict):
+            data = dict(data)
+        self._data: Dict[str, Any] = data
+        # Values as handed out to callers, built on first access
+        self._namespace: Dict[str, Any] | None = None
 
     def __getitem__(self, key: str) -> Any:
-        return _wrap_nested(self._data[key])
+        return self._get_namespace()[key]
 
     def __setitem__(self, key, value):
         raise TypeError("Config is read-only")
@@ -30,45 +46,68 @@ class Config(Mapping[str, Any]):
         raise TypeError("Config is read-only")
 
     def __iter__(self) -> Iterator[str]:
-        return iter(self._data)
+        return iter(self._get_namespace())
 
     def __len__(self) -> int:
-        return len(self._data)
+        return len(self._get_namespace())
 
     def __getattr__(self, name: str) -> Any:
-        try:
-            value = self._data[name]
-        except KeyError as exc:
-            raise AttributeError(name) from exc
-        return _wrap_nested(value)
+        namespace = self._namespace
+        if namespace is None:
+            namespace = self._build_namespace()
+        value = namespace.get(name, _MISSING)
+        if value is _MISSING:
+            raise AttributeError(name)
+        return value
 
     def to_dict(self) -> Dict[str, Any]:
         """Return a deep copy of the underlying data."""
-        from copy import deepcopy
-
-        return deepcopy(self._data)
+        return {
+            key: value.to_dict() if isinstance(value, Config) else _fast_copy(value)
+            for key, value in self._get_namespace().items()
+        }
 
     def get(self, key: str, default: Any = None) -> Any:
         """Return value for key if present, else default."""
-        if key in self._data:
-            return _wrap_nested(self._data[key])
-        return default
+        return self._get_namespace().get(key, default)
 
     def __repr__(self) -> str:
         # Avoid dumping potentially huge or sensitive configs verbosely
-        keys_preview = ", ".join(list(self._data.keys())[:5])
-        more = "..." if len(self._data) > 5 else ""
+        namespace = self._get_namespace()
+        keys_preview = ", ".join(list(namespace)[:5])
+        more = "..." if len(namespace) > 5 else ""
         #return f"Config(keys=[{keys_preview}{more}])"
         return f"<Config keys=[{keys_preview}{more}]>"
 
+    def _get_namespace(self) -> Dict[str, Any]:
+        namespace = self._namespace
+        if namespace is None:
+            namespace = self._build_namespace()
+        return namespace
 
-def _wrap_nested(value: Any) -> Any:
-    """
-    Wrap nested mappings in Config so attribute access works recursively.
-    """
-    if isinstance(value, Mapping) and not isinstance(value, Config):
-        return Config(value)
-    return value
+    def _build_namespace(self) -> Dict[str, Any]:
+        """
+        Build the key -> value lookup used by all access methods.
+
+        Nested mappings are wrapped in Config once, here, so attribute access
+        works recursively and every later lookup is a single dict access.
+        Plain dicts are already part of this (read-only) snapshot and are
+        shared, not copied; their own namespaces are built on demand.
+
+        String keys are interned: attribute names are interned by Python, so
+        `cfg.section` then finds its key by identity instead of comparing
+        the strings.
+        """
+        namespace = {
+            (intern(key) if type(key) is str else key): (
+                Config(value, _copy=False)
+                if isinstance(value, Mapping) and not isinstance(value, Config)
+                else value
+            )
+            for key, value in self._data.items()
+        }
+        self._namespace = namespace
+        return namespace
 
 
 class ConfigManager:
@@ -91,6 +130,18 @@ class ConfigManager:
 
         cfg = manager.load()
         db_host = cfg.database.host
+
+    Every load() validates the merged data against the schema. Pass
+    cache_validations=True to remember the last successful validation
+    instead: if a later load() merges to the very same data, the previous
+    Config is returned without validating again. Detecting that costs a
+    repr() of the merged data on every load(), which only pays off when
+    validation is slower than that (large schemas validated by jsonschema)
+    and the data rarely changes.
+
+    The schema is compiled on the first load() by default. Pass
+    precompile_schema=True to compile it in the constructor instead, so an
+    invalid schema fails fast and no load() pays for compilation.
     """
 
     def __init__(
@@ -98,11 +149,23 @@ class ConfigManager:
         sources: Iterable[ConfigSource],
         *,
         schema: Mapping[str, Any] | None = None,
+        cache_validations: bool = False,
+        precompile_schema: bool = False,
     ):
         self._sources = list(sources)
         if not self._sources:
             raise ValueError("At least one configuration source must be provided.")
-        self._schema = schema
+        # Compiled on the first load() (or now, if requested); later loads
+        # reuse the same validator. Schemas accepting everything are skipped.
+        self._validator: _CompiledSchema | None = None
+        if schema is not None and not _is_trivial_schema(schema):
+            self._validator = _CompiledSchema(schema)
+            if precompile_schema:
+                self._validator.compile()
+        self._cache_validations = cache_validations
+        # Snapshot (repr) of the last validated data and the resulting Config
+        self._last_snapshot: str | None = None
+        self._last_config: Config | None = None
 
     def load(self) -> Config:
         """
@@ -110,19 +173,46 @@ class ConfigManager:
 
         The sources are applied in the given order; later sources override earlier ones.
         """
-        merged: Dict[str, Any] = {}
+        loaded: list[Mapping[str, Any]] = []
 
         for source in self._sources:
             data = source.load()
             if data is None:
                 continue
-            if not isinstance(data, Mapping):
-                raise ConfigurationError(
-                    f"Configuration source {source!r} returned a non-mapping value."
-                )
-            merged = deep_merge(merged, data)
-
-        # Validate, if a schema is provided
-        validate_config(merged, self._schema)
-
-        return Config(merged)
+            # Cheap concrete check first; other mappings are converted
+            if not isinstance(data, dict):
+                if not isinstance(data, Mapping):
+                    raise ConfigurationError(
+                        f"Configuration source {source!r} returned a "
+                        "non-mapping value."
+                    )
+                data = dict(data)
+            loaded.append(data)
+
+        # Copy-on-write merge: sections are shared with the sources until a
+        # later source changes them, so a single source is just shallow-copied.
+        merged: Dict[str, Any] = {}
+        owned: set[int] = set()
+        for data in loaded:
+            _deep_merge_inplace(merged, data, owned)
+
+        if self._validator is None:
+            # `merged` was built for this call only, no need to copy it again
+            return Config(merged, _copy=False)
+
+        # repr() tells apart values that compare equal (True vs 1 vs 1.0)
+        snapshot = repr(merged) if self._cache_validations else None
+        if (
+            snapshot is not None
+            and snapshot == self._last_snapshot
+            and self._last_config is not None
+        ):
+            return self._last_config
+
+        self._validator.validator(merged)
+        config = Config(merged, _copy=False)
+
+        if snapshot is not None:
+            self._last_snapshot = snapshot
+            self._last_config = config
+        return config
@@ -6,11 +6,17 @@ from pathlib import Path
 from typing import Any, Dict
 
 import configparser
+import glob
+import io
 import json
+import mmap
 import os
+import re
+import sys
+import time
 
 from .exceptions import ConfigurationError
-from .utils import deep_merge
+from .utils import _fast_copy
 
 # Optional TOML support:
 # - Python >= 3.11: stdlib `tomllib`
@@ -28,12 +34,70 @@ except ImportError:  # pragma: no cover
         tomllib = None
 
 # Optional YAML support (PyYAML)
+# - Prefer the LibYAML-backed C loader/dumper, fall back to pure Python
 yaml: Any | None
+_YamlSafeLoader: Any | None
+_YamlSafeDumper: Any | None
 try:
     import yaml as _yaml
     yaml = _yaml
+    _YamlSafeLoader = getattr(_yaml, "CSafeLoader", _yaml.SafeLoader)
+    _YamlSafeDumper = getattr(_yaml, "CSafeDumper", _yaml.SafeDumper)
 except ImportError:  # pragma: no cover
     yaml = None
+    _YamlSafeLoader = None
+    _YamlSafeDumper = None
+
+
+# Optional fast JSON support (orjson), stdlib `json` is used otherwise
+orjson: Any | None
+try:
+    import orjson as _orjson
+    orjson = _orjson
+except ImportError:  # pragma: no cover
+    orjson = None
+
+# JSON files of at least this size are parsed from a memory map (orjson only)
+_JSON_MMAP_THRESHOLD = 64 * 1024
+# orjson turns integers outside the 64-bit range into floats; a run of 19+
+# digits (also matched inside strings or fractions) sends the document to
+# the stdlib parser, which keeps them exact.
+_JSON_LONG_DIGITS_RE = re.compile(rb"\d{19}")
+
+# Values that can be written to INI files
+_INI_SCALAR_TYPES = (str, int, float, bool)
+
+# Value parsing for environment variables and INI files
+_TRUE_VALUES = frozenset(("true", "yes", "on"))
+_FALSE_VALUES = frozenset(("false", "no", "off"))
+# Separator for nested keys in environment variable names
+_ENV_NESTING_SEP = "__"
+# Possible ASCII first characters of int()/float() input, including
+# "nan"/"inf"; non-ASCII decimal digits are checked with str.isdecimal()
+_NUMERIC_LEAD = frozenset("+-.0123456789nNiI")
+# Accepts exactly what int()/float() accept (`\d` also matches non-ASCII
+# decimal digits, as they do), so no exception handling is needed for
+# near-numeric strings such as versions or IP addresses.
+_DIGITS = r"\d(?:_?\d)*"
+_NUMBER_RE = re.compile(
+    rf"""
+    (?P<int>[+-]?{_DIGITS})
+  | (?P<float>
+        [+-]?
+        (?:
+            (?:(?:{_DIGITS})?\.{_DIGITS}|{_DIGITS}\.?)(?:e[+-]?{_DIGITS})?
+          | inf(?:inity)?
+          | nan
+        )
+    )
+    """,
+    re.IGNORECASE | re.VERBOSE,
+)
+
+
+# Parsed file contents shared by all FileSource instances:
+# absolute path -> (mtime_ns, size, data)
+_FILE_CACHE: Dict[Path, tuple[int, int, Mapping[str, Any]]] = {}
 
 
 class ConfigSource(ABC):
@@ -41,7 +105,12 @@ class ConfigSource(ABC):
 
     @abstractmethod
     def load(self) -> Mapping[str, Any] | None:
-        """Return a mapping with configuration values or None if nothing was loaded."""
+        """
+        Return a mapping with configuration values or None if nothing was loaded.
+
+        Nested sections should be plain dicts; only those are deep-merged by
+        ConfigManager, other values replace earlier ones as a whole.
+        """
         raise NotImplementedError
 
 
@@ -60,17 +129,54 @@ class FileSource(ConfigSource):
     Load configuration from a single file.
 
     Supported formats (by extension):
-      - .json
+      - .json  (uses orjson if installed)
       - .toml  (requires Python 3.11+ or tomli)
       - .ini, .cfg, .conf (ConfigParser)
       - .yaml, .yml (requires PyYAML)
 
     Values are returned as a nested mapping.
+
+    Parsed contents are cached per file, shared between all FileSource
+    instances, and reused as long as the file's modification time and size
+    are unchanged. Every load() returns a fresh deep copy of the cached
+    data, so callers may modify it freely. Pass enable_cache=False to
+    re-read and re-parse the file on every load().
+
+    Subclasses can support further formats by extending `_LOADERS` and
+    `_DUMPERS`, which map a lower-case suffix to a method name.
     """
 
-    def __init__(self, path: str | Path, *, optional: bool = False):
+    _LOADERS: Dict[str, str] = {
+        ".json": "_load_json",
+        ".toml": "_load_toml",
+        ".ini": "_load_ini",
+        ".cfg": "_load_ini",
+        ".conf": "_load_ini",
+        ".yaml": "_load_yaml",
+        ".yml": "_load_yaml",
+    }
+    _DUMPERS: Dict[str, str] = {
+        ".json": "_dump_json",
+        ".toml": "_dump_toml",
+        ".ini": "_dump_ini",
+        ".cfg": "_dump_ini",
+        ".conf": "_dump_ini",
+        ".yaml": "_dump_yaml",
+        ".yml": "_dump_yaml",
+    }
+
+    def __init__(
+        self,
+        path: str | Path,
+        *,
+        optional: bool = False,
+        enable_cache: bool = True,
+    ):
         self._path = Path(path).expanduser()
         self._optional = optional
+        self._enable_cache = enable_cache
+        # Absolute, so that relative paths stay valid cache keys after chdir
+        self._cache_key = self._path.absolute()
 
     def load(self) -> Mapping[str, Any] | None:
         if not self._path.exists():
@@ -78,21 +184,31 @@ class FileSource(ConfigSource):
                 return None
             raise ConfigurationError(f"Configuration file not found: {self._path}")
 
-        suffix = self._path.suffix.lower()
+        st: os.stat_result | None = None
+        if self._enable_cache:
+            st = self._path.stat()
+            cached = _FILE_CACHE.get(self._cache_key)
+            if (
+                cached is not None
+                and cached[0] == st.st_mtime_ns
+                and cached[1] == st.st_size
+            ):
+                return _fast_copy(cached[2])
 
-        if suffix == ".json":
-            return self._load_json()
-        if suffix == ".toml":
-            return self._load_toml()
-        if suffix in {".ini", ".cfg", ".conf"}:
-            return self._load_ini()
-        if suffix in {".yaml", ".yml"}:
-            return self._load_yaml()
+        suffix = self._path.suffix.lower()
+        method_name = self._LOADERS.get(suffix)
+        if method_name is None:
+            raise ConfigurationError(
+                f"Unsupported configuration file format: {self._path} "
+                f"(extension '{suffix}')"
+            )
+        data = getattr(self, method_name)()
 
-        raise ConfigurationError(
-            f"Unsupported configuration file format: {self._path} "
-            f"(extension '{suffix}')"
-        )
+        if st is not None:
+            # Callers only ever get copies, so the cached data stays pristine
+            _FILE_CACHE[self._cache_key] = (st.st_mtime_ns, st.st_size, data)
+            return _fast_copy(data)
+        return data
 
     def dump(self, data: Mapping[str, Any]) -> None:
         """
@@ -102,50 +218,48 @@ class FileSource(ConfigSource):
         rules as for `load()`. The write is performed atomically by writing
         to a temporary file and then replacing the target file.
         """
-        from pathlib import Path
-
-        # Ensure parent directory exists
-        self._path.parent.mkdir(parents=True, exist_ok=True)
-
         suffix = self._path.suffix.lower()
-        tmp_path = self._path.with_suffix(self._path.suffix + ".tmp")
-
-        if suffix == ".json":
-            self._dump_json(tmp_path, data)
-        elif suffix == ".toml":
-            self._dump_toml(tmp_path, data)
-        elif suffix in {".ini", ".cfg", ".conf"}:
-            self._dump_ini(tmp_path, data)
-        elif suffix in {".yaml", ".yml"}:
-            self._dump_yaml(tmp_path, data)
-        else:
+        method_name = self._DUMPERS.get(suffix)
+        if method_name is None:
             raise ConfigurationError(
                 f"Unsupported configuration file format for writing: {self._path} "
                 f"(extension '{suffix}')"
             )
 
-        # Atomic replace (os.replace), overwrites existing file
+        # Ensure parent directory exists
+        self._path.parent.mkdir(parents=True, exist_ok=True)
+
+        payload: bytes = getattr(self, method_name)(data)
+
         try:
-            tmp_path.replace(self._path)
+            _atomic_write(self._path, payload)
         except OSError as exc:
             raise ConfigurationError(
-                f"Could not move temporary config file {tmp_path!r} to {self._path!r}: {exc}"
+                f"Could not write config file {self._path!r}: {exc}"
             ) from exc
 
+        # Do not rely on mtime granularity to notice our own write
+        _FILE_CACHE.pop(self._cache_key, None)
+
     def _load_json(self) -> Mapping[str, Any]:
         try:
-            with self._path.open("r", encoding="utf-8") as f:
-                return json.load(f)
+            if orjson is None:
+                return json.loads(self._path.read_bytes())
+            with self._path.open("rb") as f:
+                if os.fstat(f.fileno()).st_size < _JSON_MMAP_THRESHOLD:
+                    return _orjson_loads(f.read())
+                # orjson parses straight from the mapped pages, so large
+                # files are never copied into a bytes object first.
+                with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                    with memoryview(mm) as view:
+                        return _orjson_loads(view)
         except (OSError, json.JSONDecodeError) as exc:
             raise ConfigurationError(f"Invalid JSON in {self._path}: {exc}") from exc
 
-    def _dump_json(self, path: Path, data: Mapping[str, Any]) -> None:
-        try:
-            with path.open("w", encoding="utf-8") as f:
-                json.dump(data, f, indent=2, sort_keys=True)
-                f.write("\n")
-        except OSError as exc:
-            raise ConfigurationError(f"Could not write JSON config {path!r}: {exc}") from exc
+    def _dump_json(self, data: Mapping[str, Any]) -> bytes:
+        # Always the stdlib: orjson would write NaN/Infinity as null, reject
+        # integers beyond 64 bits and format floats and non-ASCII differently.
+        return (json.dumps(data, indent=2, sort_keys=True) + "\n").encode("utf-8")
 
     def _load_toml(self) -> Mapping[str, Any]:
         if tomllib is None:
@@ -154,13 +268,12 @@ class FileSource(ConfigSource):
                 "nor 'tomli' is available. Install 'tomli' to enable TOML support."
             )
         try:
-            with self._path.open("rb") as f:
-                return tomllib.load(f)
+            return tomllib.loads(self._path.read_text(encoding="utf-8"))
         #TODO: tomllib.TOMLDecodeError
         except Exception as exc:
             raise ConfigurationError(f"Invalid TOML in {self._path}: {exc}") from exc
 
-    def _dump_toml(self, path: Path, data: Mapping[str, Any]) -> None:
+    def _dump_toml(self, data: Mapping[str, Any]) -> bytes:
         try:
             import tomli_w  # optional dependency
         except ImportError as exc:
@@ -170,47 +283,40 @@ class FileSource(ConfigSource):
 
         try:
             toml_text = tomli_w.dumps(data)
-            # tomli_w.dumps may return bytes or str depending on version
-            if not isinstance(toml_text, str):
-                toml_text = toml_text.decode("utf-8")
-
-            with path.open("w", encoding="utf-8") as f:
-                f.write(toml_text)
         except Exception as exc:
-            raise ConfigurationError(f"Could not write TOML config {path!r}: {exc}") from exc
+            raise ConfigurationError(
+                f"Could not write TOML config {self._path!r}: {exc}"
+            ) from exc
+
+        # tomli_w.dumps may return bytes or str depending on version
+        if isinstance(toml_text, str):
+            return toml_text.encode("utf-8")
+        return toml_text
 
     def _load_ini(self) -> Mapping[str, Any]:
         # Disable interpolation for predictable behavior
         parser = configparser.ConfigParser(interpolation=None)
         try:
-            with self._path.open("r", encoding="utf-8") as f:
-                parser.read_file(f)
+            parser.read_string(
+                self._path.read_text(encoding="utf-8"), source=str(self._path)
+            )
         except Exception as exc:
             raise ConfigurationError(
                 f"Error reading INI file {self._path}: {exc}"
             ) from exc
 
-        data: Dict[str, Dict[str, Any]] = {}
-        for section in parser.sections():
-            section_dict: Dict[str, Any] = {}
-            for key, value in parser.items(section):
-                section_dict[key] = _parse_env_like_value(value)
-            data[section] = section_dict
+        data: Dict[str, Dict[str, Any]] = {
+            section: {
+                key: _parse_env_like_value(value)
+                for key, value in parser.items(section)
+            }
+            for section in parser.sections()
+        }
         return data
 
-    def _dump_ini(self, path: Path, data: Mapping[str, Any]) -> None:
+    def _dump_ini(self, data: Mapping[str, Any]) -> bytes:
         parser = configparser.ConfigParser(interpolation=None)
 
-        def _ensure_scalar(value: Any, path_str: str) -> str:
-            if isinstance(value, (str, int, float, bool)):
-                return str(value)
-
-            raise ConfigurationError(
-                "Cannot dump non-scalar value at "
-                f"{path_str!r} to INI; INI is limited to flat key/value "
-                "pairs. Use JSON, TOML or YAML for nested structures."
-            )
-
         for section_name, section_value in data.items():
             if not isinstance(section_value, Mapping):
                 raise ConfigurationError(
@@ -225,16 +331,21 @@ class FileSource(ConfigSource):
             section = parser[section_name_str]
 
             for option, option_value in section_value.items():
-                key_path = f"{section_name_str}.{option}"
-                section[str(option)] = _ensure_scalar(option_value, key_path)
-
-        try:
-            with path.open("w", encoding="utf-8") as f:
-                parser.write(f)
-        except OSError as exc:
-            raise ConfigurationError(
-                f"Could not write INI config {path!r}: {exc}"
-            ) from exc
+                # Exact type check first, isinstance() only for subclasses
+                if type(option_value) not in _INI_SCALAR_TYPES and not isinstance(
+                    option_value, _INI_SCALAR_TYPES
+                ):
+                    key_path = f"{section_name_str}.{option}"
+                    raise ConfigurationError(
+                        "Cannot dump non-scalar value at "
+                        f"{key_path!r} to INI; INI is limited to flat key/value "
+                        "pairs. Use JSON, TOML or YAML for nested structures."
+                    )
+                section[str(option)] = str(option_value)
+
+        buffer = io.StringIO()
+        parser.write(buffer)
+        return buffer.getvalue().encode("utf-8")
 
     def _load_yaml(self) -> Mapping[str, Any]:
         if yaml is None:
@@ -242,8 +353,7 @@ class FileSource(ConfigSource):
                 "YAML configuration requested but 'PyYAML' is not installed."
             )
         try:
-            with self._path.open("r", encoding="utf-8") as f:
-                data = yaml.safe_load(f)
+            data = yaml.load(self._path.read_bytes(), Loader=_YamlSafeLoader)
         except Exception as exc:
             raise ConfigurationError(f"Invalid YAML in {self._path}: {exc}") from exc
 
@@ -255,22 +365,19 @@ class FileSource(ConfigSource):
             )
         return data
 
-    def _dump_yaml(self, path: Path, data: Mapping[str, Any]) -> None:
+    def _dump_yaml(self, data: Mapping[str, Any]) -> bytes:
         if yaml is None:
             raise ConfigurationError(
                 "Writing YAML configuration requires the optional 'PyYAML' package."
             )
 
-        try:
-            with path.open("w", encoding="utf-8") as f:
-                yaml.safe_dump(
-                    dict(data),
-                    f,
-                    sort_keys=False,
-                    default_flow_style=False,
-                )
-        except OSError as exc:
-            raise ConfigurationError(f"Could not write YAML config {path!r}: {exc}") from exc
+        return yaml.dump(
+            dict(data),
+            Dumper=_YamlSafeDumper,
+            encoding="utf-8",
+            sort_keys=False,
+            default_flow_style=False,
+        )
 
 
 class EnvSource(ConfigSource):
@@ -302,34 +409,69 @@ class EnvSource(ConfigSource):
 
     def load(self) -> Mapping[str, Any] | None:
         result: Dict[str, Any] = {}
-        prefix_len = len(self._prefix)
-
-        for key, value in os.environ.items():
-            if not key.startswith(self._prefix):
+        prefix = self._prefix
+        prefix_len = len(prefix)
+
+        # Filter on names only: os.environ decodes values lazily, so only
+        # the values of matching variables are ever decoded.
+        env = os.environ
+        matches = [
+            (key[prefix_len:].lower(), env[key])
+            for key in env
+            if key.startswith(prefix)
+        ]
+        # Parent dict of each path resolved so far; variables usually share
+        # a few sections, so most paths are only walked once.
+        parents: Dict[tuple[str, ...], Dict[str, Any]] = {}
+        for raw_key, value in matches:
+            # Also drops keys that are empty after removing the prefix.
+            # Interned, so the same key is one shared string across loads.
+            parts = list(
+                map(sys.intern, filter(None, raw_key.split(_ENV_NESTING_SEP)))
+            )
+            if not parts:
                 continue
 
-            raw_key = key[prefix_len:]
-            if not raw_key:
-                continue
+            # Walk/create the "__"-separated path directly in the result;
+            # later variables override earlier ones on conflicts.
+            path = tuple(parts[:-1])
+            current = parents.get(path)
+            if current is None:
+                current = result
+                for part in path:
+                    child = current.get(part)
+                    if not isinstance(child, dict):
+                        child = {}
+                        current[part] = child
+                    current = child
+                parents[path] = current
+
+            leaf = parts[-1]
+            if isinstance(current.get(leaf), dict):
+                # A value replaces a whole section, which detaches the
+                # dicts resolved below it
+                parents.clear()
+            current[leaf] = _parse_env_like_value(value)
 
-            parts = [p.lower() for p in raw_key.split("__") if p]
-            if not parts:
-                continue
+        return result or None
 
-            # Build a nested dict structure based on "__"-separated path
-            nested: Dict[str, Any] = {}
-            current: Dict[str, Any] = nested
-            for part in parts[:-1]:
-                child = current.get(part)
-                if not isinstance(child, dict):
-                    child = {}
-                    current[part] = child
-                current = child
 
-            current[parts[-1]] = _parse_env_like_value(value)
-            result = deep_merge(result, nested)
+def _orjson_loads(data: bytes | memoryview) -> Any:
+    """
+    Parse JSON with orjson, with the same results as the stdlib parser.
 
-        return result or None
+    Documents orjson reads differently (integers outside 64 bits) or not at
+    all (NaN, Infinity, numbers overflowing a float) go to `json.loads`,
+    which then also produces the error message for invalid JSON.
+    """
+    assert orjson is not None
+    if _JSON_LONG_DIGITS_RE.search(data) is None:
+        try:
+            return orjson.loads(data)
+        except orjson.JSONDecodeError:
+            pass
+    # json.loads() does not take buffers, so a mapped file is copied here
+    return json.loads(data if isinstance(data, bytes) else data.tobytes())
 
 
 def _parse_env_like_value(raw: str) -> Any:
@@ -342,25 +484,27 @@ def _parse_env_like_value(raw: str) -> Any:
       - float strings to float
     Leaves everything else as str.
     """
-    lowered = raw.strip().lower()
-    if lowered in {"true", "yes", "on"}:
+    stripped = raw.strip()
+    lowered = stripped.lower()
+    if lowered in _TRUE_VALUES:
         return True
-    if lowered in {"false", "no", "off"}:
+    if lowered in _FALSE_VALUES:
         return False
 
-    # Try int
-    try:
-        return int(raw)
-    except ValueError:
-        pass
+    # Cheap pre-check: most values are plain strings, skip the number
+    # matching entirely unless it can possibly be a number.
+    if not stripped:
+        return raw
+    lead = stripped[0]
+    if lead not in _NUMERIC_LEAD and not lead.isdecimal():
+        return raw
 
-    # Try float
-    try:
-        return float(raw)
-    except ValueError:
-        pass
-
-    return raw
+    match = _NUMBER_RE.fullmatch(stripped)
+    if match is None:
+        return raw
+    if match.lastgroup == "int":
+        return int(stripped)
+    return float(stripped)
 
 
 def _apply_file_mode(path: Path, mode: int | None) -> None:
@@ -381,6 +525,100 @@ def _apply_file_mode(path: Path, mode: int | None) -> None:
         ) from exc
 
 
+# Windows would otherwise translate newlines on os.write()
+_O_BINARY: int = getattr(os, "O_BINARY", 0)
+
+
+def _atomic_write(
+    path: Path, payload: bytes | bytearray | memoryview, mode: int | None = None
+) -> None:
+    """
+    Atomically replace `path` with `payload`.
+
+    The data is written to a sibling ".tmp.<pid>" file, created with its
+    final permissions, which is then moved into place with os.replace().
+    Afterwards, temp files that crashed writers left behind are removed,
+    see _remove_stale_tmp_files().
+
+    :param mode: Optional permission bits, applied before the file gets its
+        final name.
+    :raises OSError: on I/O errors.
+    """
+    started = time.time()
+    # Per-process name, so concurrent writers never share a temp file
+    tmp_path = path.with_name(f"{path.name}.tmp.{os.getpid()}")
+
+    fd = os.open(
+        tmp_path,
+        os.O_WRONLY | os.O_CREAT | os.O_TRUNC | _O_BINARY,
+        0o666 if mode is None else mode & 0o777,
+    )
+    try:
+        _write_fd(fd, payload, mode)
+    except OSError:
+        os.close(fd)
+        tmp_path.unlink(missing_ok=True)
+        raise
+    os.close(fd)
+
+    try:
+        os.replace(tmp_path, path)
+    except OSError:
+        tmp_path.unlink(missing_ok=True)
+        raise
+
+    _remove_stale_tmp_files(path, started)
+
+
+def _remove_stale_tmp_files(path: Path, started: float) -> None:
+    """
+    Remove ".tmp.<pid>" files of `path` left behind by crashed writers.
+
+    A temp file is stale if it was last modified before the current write
+    started and (where this can be checked, i.e. on POSIX) its process no
+    longer exists. Errors are ignored; cleanup is best effort.
+    """
+    prefix = f"{path.name}.tmp."
+    for candidate in path.parent.glob(glob.escape(prefix) + "*"):
+        pid = candidate.name[len(prefix):]
+        if not pid.isdecimal() or int(pid) == os.getpid():
+            continue
+        try:
+            if candidate.stat().st_mtime >= started or _process_exists(int(pid)):
+                continue
+            candidate.unlink()
+        except OSError:
+            continue
+
+
+def _process_exists(pid: int) -> bool:
+    """Return True if process `pid` may still be running."""
+    if os.name != "posix":
+        # os.kill() would terminate it on Windows; rely on the mtime check
+        return False
+    try:
+        os.kill(pid, 0)
+    except ProcessLookupError:
+        return False
+    except OSError:
+        # Exists, but belongs to someone else
+        return True
+    return True
+
+
+def _write_fd(
+    fd: int, payload: bytes | bytearray | memoryview, mode: int | None
+) -> None:
+    """Apply `mode` (if given) to an open file and write all of `payload`."""
+    if mode is not None and hasattr(os, "fchmod"):
+        os.fchmod(fd, mode & 0o777)
+
+    view = memoryview(payload)
+    while view:
+        written = os.write(fd, view)
+        view = view[written:]
+
+
 class RawSource:
     """
     Read and write raw configuration data from a single file.
@@ -414,7 +652,8 @@ class RawSource:
         :param errors: Error handling strategy in text mode ('strict' by default).
         :param optional: If True, missing file on load() returns None instead of raising.
         :param file_mode: Optional POSIX file mode (e.g. 0o600). If provided,
-                          chmod() is called on the temp file and final file.
+                          the new file is created with it, before any data
+                          is written, and it is re-applied to the final file.
         """
         self._path = Path(path).expanduser()
         self._binary = bool(binary)
@@ -465,7 +704,8 @@ class RawSource:
         Write raw content to the file atomically.
 
         - Writes to a temporary file next to the target.
-        - Optionally applies a restrictive file_mode (e.g. 0o600).
+        - Optionally creates that file with a restrictive file_mode
+          (e.g. 0o600), before any data is written to it.
         - Uses os.replace() to atomically move the temp file into place.
 
         :param data: str (for binary=False) or bytes (for binary=True).
@@ -477,37 +717,24 @@ class RawSource:
                 raise TypeError(
                     "RawSource(binary=True).dump() expects bytes-like data."
                 )
-            payload: bytes
-            if isinstance(data, bytes):
-                payload = data
-            else:
-                payload = bytes(data)
+            # Written straight from the caller's buffer, without a copy.
+            # Memoryviews are cast to bytes so that partial writes can be
+            # resumed by byte offset; only non-contiguous ones are copied.
+            payload: bytes | bytearray | memoryview = data
+            if isinstance(data, memoryview):
+                payload = data.cast("B") if data.c_contiguous else data.tobytes()
         else:
             if not isinstance(data, str):
                 raise TypeError(
                     "RawSource(binary=False).dump() expects 'str' data."
                 )
-            payload = data
+            payload = data.encode(self._encoding, self._errors)
 
         # Ensure parent directory exists
         self._path.parent.mkdir(parents=True, exist_ok=True)
 
-        tmp_path = self._path.with_suffix(self._path.suffix + ".tmp")
-
         try:
-            if self._binary:
-                with tmp_path.open("wb") as f:
-                    f.write(payload)
-            else:
-                with tmp_path.open(
-                    "w", encoding=self._encoding, errors=self._errors
-                ) as f:
-                    f.write(payload)
-
-            # Apply requested file mode to the temp file and final file
-            _apply_file_mode(tmp_path, self._file_mode)
-
-            tmp_path.replace(self._path)
+            _atomic_write(self._path, payload, self._file_mode)
 
             # Re-apply mode on the final file in case the filesystem adjusts it
             _apply_file_mode(self._path, self._file_mode)
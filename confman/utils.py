@@ -1,25 +1,88 @@
 from __future__ import annotations
 
 from collections.abc import Mapping
-from typing import Any, Dict
+from copy import deepcopy
+from typing import Any, Dict, List, Set, Tuple
+
+# Guards against cyclic data, which would otherwise be merged forever
+_MAX_MERGE_DEPTH = 1000
 
 
 def deep_merge(base: Mapping[str, Any], override: Mapping[str, Any]) -> Dict[str, Any]:
     """
-    Recursively merge two mappings.
+    Deep-merge two mappings.
 
     Values from `override` take precedence.
-    Nested mappings are merged, all other values are replaced.
+    Nested dicts are merged, all other values (including other mapping
+    types) are replaced. Neither input is modified; subtrees that need no
+    merging are shared with the inputs instead of being copied.
     """
+    if not base:
+        return dict(override)
+    if not override:
+        return dict(base)
+
     result: Dict[str, Any] = dict(base)
-    #TODO: recursion protect
-    for key, value in override.items():
-        if (
-            key in result
-            and isinstance(result[key], Mapping)
-            and isinstance(value, Mapping)
-        ):
-            result[key] = deep_merge(result[key], value)
-        else:
-            result[key] = value
+    _deep_merge_inplace(result, override, set())
     return result
+
+
+def _deep_merge_inplace(
+    dst: Dict[str, Any], src: Mapping[str, Any], owned: Set[int]
+) -> None:
+    """
+    Merge `src` into `dst` in place, copy-on-write.
+
+    Only `dst` itself must be private to the caller. Nested dicts that it
+    (still) shares with earlier inputs are cloned right before they are
+    first modified, and their ids are recorded in `owned`; pass the same set
+    for successive merges into the same `dst` so that every subtree is
+    cloned at most once. Untouched subtrees, and new ones from `src`, are
+    stored without copying.
+
+    Works iteratively with an explicit stack, so deep nesting costs no
+    Python call frames; nesting deeper than _MAX_MERGE_DEPTH (which usually
+    means cyclic data) raises ValueError.
+    """
+    stack: List[Tuple[Dict[str, Any], Mapping[str, Any], int]] = [(dst, src, 0)]
+    while stack:
+        target, source, depth = stack.pop()
+        for key, value in source.items():
+            child = target.get(key)
+            if isinstance(value, dict) and isinstance(child, dict):
+                if id(child) not in owned:
+                    child = target[key] = dict(child)
+                    owned.add(id(child))
+                if depth >= _MAX_MERGE_DEPTH:
+                    raise ValueError(
+                        f"Cannot merge mappings nested deeper than {_MAX_MERGE_DEPTH} "
+                        "levels (cyclic data?)."
+                    )
+                stack.append((child, value, depth + 1))
+            else:
+                target[key] = value
+
+
+# Immutable value types that never need copying
+_ATOMIC_TYPES = frozenset((str, int, float, bool, bytes, type(None)))
+
+
+def _fast_copy(value: Any) -> Any:
+    """
+    Deep-copy JSON-shaped data (dicts, lists and scalars).
+
+    Much cheaper than copy.deepcopy for configuration data; anything that is
+    not a plain dict, list or immutable scalar is handed to deepcopy.
+    """
+    value_type = type(value)
+    # Scalars are checked inline to save a call per leaf value
+    if value_type is dict:
+        return {
+            k: v if type(v) in _ATOMIC_TYPES else _fast_copy(v)
+            for k, v in value.items()
+        }
+    if value_type is list:
+        return [v if type(v) in _ATOMIC_TYPES else _fast_copy(v) for v in value]
+    if value_type in _ATOMIC_TYPES:
+        return value
+    return deepcopy(value)
@@ -1,21 +1,141 @@
 from __future__ import annotations
 
-from typing import Any, Mapping
+from functools import cached_property
+from typing import Any, Callable, Dict, Mapping, Tuple
 
 from .exceptions import ConfigurationError
 
+# Validators take plain dicts: both backends only accept dict as an object
+Validator = Callable[[Dict[str, Any]], None]
 
-def validate_config(data: Mapping[str, Any], schema: Mapping[str, Any] | None) -> None:
+# Validators compiled by validate_config(), keyed by id(schema). The schema
+# is stored alongside, which keeps it alive so its id cannot be reused.
+_VALIDATOR_CACHE: Dict[int, Tuple[Mapping[str, Any], Validator]] = {}
+_VALIDATOR_CACHE_SIZE = 32
+
+# Keywords that never constrain the data
+_ANNOTATION_KEYWORDS = frozenset(
+    ("$schema", "$id", "$comment", "title", "description", "type")
+)
+
+# Optional fast backend: fastjsonschema compiles a schema to Python code.
+# It needs `use_formats` (2.19+) to ignore "format" the way jsonschema does.
+fastjsonschema: Any | None
+try:
+    import fastjsonschema as _fastjsonschema
+    fastjsonschema = _fastjsonschema
+    if tuple(map(int, _fastjsonschema.VERSION.split(".")[:2])) < (2, 19):
+        fastjsonschema = None  # pragma: no cover
+except ImportError:  # pragma: no cover - optional dependency
+    fastjsonschema = None
+
+# `$schema` URIs (without trailing "#") of the drafts fastjsonschema fully
+# implements. Other schemas, including those without `$schema` (which
+# jsonschema treats as the latest draft), are validated by jsonschema.
+_FASTJSONSCHEMA_DRAFTS = frozenset(
+    f"{scheme}://json-schema.org/draft-{draft}/schema"
+    for scheme in ("http", "https")
+    for draft in ("04", "06", "07")
+)
+
+
+def compile_schema(schema: Mapping[str, Any]) -> Validator:
     """
-    Validate configuration data against a JSON Schema.
+    Compile a JSON Schema into a reusable validation function.
 
-    :param data: Configuration mapping to validate.
-    :param schema: JSON Schema mapping. If None, validation is skipped.
-    :raises ConfigurationError: if validation fails or jsonschema is missing.
+    The schema is checked and the validator is built once, so calling the
+    returned function only pays for validating the data itself. Schemas
+    declaring draft-04, -06 or -07 in `$schema` are compiled with
+    `fastjsonschema` if it is installed; everything else uses `jsonschema`.
+
+    :param schema: JSON Schema mapping.
+    :returns: Callable validating a configuration dict against the schema.
+        It must be given a plain dict; other mappings are not objects to
+        either backend.
+    :raises ConfigurationError: if the schema is invalid or jsonschema is missing.
     """
-    if schema is None:
-        return
+    if _is_trivial_schema(schema):
+        return _accept_all
+    # Boolean schemas (only `False` gets here) are passed through as they are
+    if type(schema) is not dict and isinstance(schema, Mapping):
+        schema = dict(schema)
+    if _use_fastjsonschema(schema):
+        return _compile_fastjsonschema(schema)
+    return _compile_jsonschema(schema)
+
+
+def _use_fastjsonschema(schema: Dict[str, Any] | bool) -> bool:
+    """Return True if fastjsonschema validates `schema` like jsonschema would."""
+    if fastjsonschema is None or not isinstance(schema, dict):
+        return False
+    uri = schema.get("$schema")
+    return isinstance(uri, str) and uri.rstrip("#") in _FASTJSONSCHEMA_DRAFTS
+
+
+def _is_trivial_schema(schema: Mapping[str, Any]) -> bool:
+    """
+    Return True if `schema` accepts every configuration mapping.
 
+    That is the case for an empty schema, for one that only carries
+    annotations plus `"type": "object"`, and for the boolean schema `true`.
+    """
+    if not isinstance(schema, Mapping):
+        return schema is True
+    if not schema.keys() <= _ANNOTATION_KEYWORDS:
+        return False
+    return schema.get("type", "object") == "object"
+
+
+def _accept_all(data: Dict[str, Any]) -> None:
+    """Validator for trivial schemas."""
+
+
+# URI schemes fastjsonschema would otherwise fetch `$ref`s from with urlopen()
+# at compile time; jsonschema never fetches remote references either.
+_REMOTE_REF_SCHEMES = ("http", "https", "ftp", "file", "data")
+
+
+def _compile_fastjsonschema(schema: Dict[str, Any]) -> Validator:
+    assert fastjsonschema is not None
+    # fastjsonschema does not check the schema itself and fails with
+    # arbitrary exceptions on malformed ones
+    _checked_validator_cls(schema)
+    handlers = dict.fromkeys(_REMOTE_REF_SCHEMES, _reject_remote_ref)
+    try:
+        # use_default=False: never inject schema defaults into the data.
+        # use_formats=False: jsonschema does not check "format" either.
+        compiled = fastjsonschema.compile(
+            schema, handlers=handlers, use_default=False, use_formats=False
+        )
+    except fastjsonschema.JsonSchemaDefinitionException as exc:
+        raise ConfigurationError(f"Invalid configuration schema: {exc}") from exc
+
+    def validate(data: Dict[str, Any]) -> None:
+        try:
+            compiled(data)
+        except fastjsonschema.JsonSchemaValueException as exc:
+            # exc.path starts with the name of the root object ("data")
+            path = exc.path[1:]
+            path_str = ".".join(str(p) for p in path) if path else "<root>"
+            raise ConfigurationError(
+                f"Configuration validation error at '{path_str}': {exc.message}"
+            ) from exc
+
+    return validate
+
+
+def _reject_remote_ref(uri: str) -> Any:
+    assert fastjsonschema is not None
+    raise fastjsonschema.JsonSchemaDefinitionException(
+        f"remote $ref {uri!r} is not supported"
+    )
+
+
+def _checked_validator_cls(schema: Dict[str, Any] | bool) -> Any:
+    """
+    Return the jsonschema validator class for `schema`, after checking the
+    schema against its meta-schema.
+    """
     try:
         import jsonschema
     except ImportError as exc:  # pragma: no cover - optional dependency
@@ -23,13 +143,106 @@ def validate_config(data: Mapping[str, Any], schema: Mapping[str, Any] | None) -
             "JSON Schema validation requested but 'jsonschema' package is not installed."
         ) from exc
 
+    validator_cls = jsonschema.validators.validator_for(schema)
     try:
-        jsonschema.validate(instance=data, schema=schema)
-    except Exception as exc:
-        #TODO: ValidationError, SchemaError
-        path = getattr(exc, "path", ())
-        path_str = ".".join(str(p) for p in path) if path else "<root>"
-        message = getattr(exc, "message", str(exc))
+        validator_cls.check_schema(schema)
+    except jsonschema.SchemaError as exc:
+        raise ConfigurationError(
+            f"Invalid configuration schema: {exc.message}"
+        ) from exc
+    return validator_cls
+
+
+def _compile_jsonschema(schema: Dict[str, Any] | bool) -> Validator:
+    validator_cls = _checked_validator_cls(schema)
+    import jsonschema  # available, checked above
+
+    # The schema was checked above; iter_errors() skips that step and lets
+    # us stop at the first error instead of ranking all of them.
+    iter_errors = validator_cls(schema).iter_errors
+    unresolvable = _unresolvable_ref_errors(jsonschema)
+
+    def validate(data: Dict[str, Any]) -> None:
+        try:
+            exc: jsonschema.ValidationError | None = next(iter_errors(data), None)
+        except unresolvable as ref_exc:
+            # $refs are only resolved while validating
+            raise ConfigurationError(
+                f"Invalid configuration schema: {ref_exc}"
+            ) from ref_exc
+        if exc is None:
+            return
+        path = exc.absolute_path
+        path_str = ".".join(map(str, path)) if path else "<root>"
         raise ConfigurationError(
-            f"Configuration validation error at '{path_str}': {message}"
+            f"Configuration validation error at '{path_str}': {exc.message}"
         ) from exc
+
+    return validate
+
+
+def _unresolvable_ref_errors(jsonschema: Any) -> Tuple[type[Exception], ...]:
+    """Return the exception types jsonschema raises for unresolvable $refs."""
+    try:
+        from referencing.exceptions import Unresolvable
+    except ImportError:  # pragma: no cover - jsonschema < 4.18
+        return (jsonschema.RefResolutionError,)
+    return (Unresolvable,)
+
+
+class _CompiledSchema:
+    """
+    JSON Schema whose validator is compiled lazily, on first use.
+
+    Constructing it is free; the schema is checked and compiled the first
+    time `validator` is accessed and then reused for every later call.
+    """
+
+    def __init__(self, schema: Mapping[str, Any]):
+        self.schema = schema
+
+    @cached_property
+    def validator(self) -> Validator:
+        return compile_schema(self.schema)
+
+    def compile(self) -> None:
+        """Compile the schema now instead of on first use."""
+        # Accessing the cached property compiles and stores the validator
+        self.validator
+
+
+def validate_config(data: Mapping[str, Any], schema: Mapping[str, Any] | None) -> None:
+    """
+    Validate configuration data against a JSON Schema.
+
+    Compiled validators are cached per schema object, so repeated calls with
+    the same schema only validate the data. Do not modify a schema mapping
+    in place after it has been used.
+
+    Plain dicts are validated as they are; other mappings are copied into
+    a dict first (top level only).
+
+    :param data: Configuration mapping to validate.
+    :param schema: JSON Schema mapping. If None, validation is skipped.
+    :raises ConfigurationError: if validation fails or jsonschema is missing.
+    """
+    if schema is None or _is_trivial_schema(schema):
+        return
+
+    if type(data) is not dict:
+        data = dict(data)
+    _cached_validator(schema)(data)
+
+
+def _cached_validator(schema: Mapping[str, Any]) -> Validator:
+    """Return the compiled validator for `schema`, compiling it on first use."""
+    entry = _VALIDATOR_CACHE.get(id(schema))
+    if entry is not None and entry[0] is schema:
+        return entry[1]
+
+    validator = compile_schema(schema)
+    if len(_VALIDATOR_CACHE) >= _VALIDATOR_CACHE_SIZE:
+        # Evict the oldest entry (dicts keep insertion order)
+        del _VALIDATOR_CACHE[next(iter(_VALIDATOR_CACHE))]
+    _VALIDATOR_CACHE[id(schema)] = (schema, validator)
+    return validator
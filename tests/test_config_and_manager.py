@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+import sys
 from typing import Any, Mapping
 
 import pytest
@@ -12,6 +13,8 @@ from confman import (
     ConfigurationError,
 )
 
+DRAFT_07 = "http://json-schema.org/draft-07/schema"
+
 
 def test_config_allows_dict_and_attribute_access():
     data = {
@@ -53,6 +56,46 @@ def test_config_to_dict_returns_deep_copy():
     assert cfg.a.b == 1
 
 
+def test_config_to_dict_copies_lists():
+    cfg = Config({"hosts": ["a", {"name": "b"}]})
+
+    d = cfg.to_dict()
+    d["hosts"].append("c")
+    d["hosts"][1]["name"] = "changed"
+
+    assert cfg.to_dict() == {"hosts": ["a", {"name": "b"}]}
+
+
+def test_config_reuses_nested_wrappers():
+    cfg = Config({"database": {"host": "localhost"}})
+
+    assert cfg.database is cfg.database
+    assert cfg["database"] is cfg.database
+    assert not hasattr(cfg, "__dict__")
+
+
+def test_config_interns_keys():
+    key = "".join(["data", "base"])  # built at runtime, so not interned
+    cfg = Config({key: {"host": "db.local"}})
+
+    interned = sys.intern("database")
+    assert any(k is interned for k in cfg._get_namespace())
+    assert cfg.database.host == "db.local"
+
+
+def test_config_is_consistent_after_shared_source_data_changes():
+    defaults = {"app": {"debug": False}}
+    cfg = ConfigManager(sources=[DictSource(defaults)]).load()
+    app = cfg.app
+    assert app.debug is False
+
+    defaults["app"]["new"] = 1
+
+    assert ("new" in app) == ("new" in list(app))
+    assert len(app) == len(list(app)) == len(app.to_dict())
+    assert set(app.to_dict()) == set(app)
+
+
 def test_config_get_with_default():
     cfg = Config({"a": 1})
 
@@ -60,6 +103,14 @@ def test_config_get_with_default():
     assert cfg.get("missing", "fallback") == "fallback"
 
 
+def test_config_missing_attribute_raises_attribute_error():
+    cfg = Config({"a": 1})
+
+    with pytest.raises(AttributeError):
+        _ = cfg.missing
+    assert getattr(cfg, "missing", None) is None
+
+
 def test_config_manager_merges_sources_in_order():
     defaults = {"app": {"debug": False, "log_level": "INFO"}}
     override = {"app": {"log_level": "DEBUG"}}
@@ -148,3 +199,252 @@ def test_config_manager_with_schema_validation_failure():
     msg = str(excinfo.value)
     assert "app.debug" in msg or "app" in msg  # path hint in error message is okay
     assert "boolean" in msg
+
+
+def test_config_manager_rejects_invalid_schema():
+    pytest.importorskip("jsonschema")
+
+    # The schema is compiled lazily, on the first load()
+    manager = ConfigManager(
+        sources=[DictSource({"app": {}})],
+        schema={"type": "not-a-real-type"},
+    )
+    with pytest.raises(ConfigurationError):
+        manager.load()
+
+    with pytest.raises(ConfigurationError):
+        ConfigManager(
+            sources=[DictSource({"app": {}})],
+            schema={"type": "not-a-real-type"},
+            precompile_schema=True,
+        )
+
+
+def test_config_manager_does_not_mutate_source_data():
+    defaults = {"app": {"debug": False}}
+    override = {"app": {"log_level": "DEBUG"}, "db": {"host": "a"}}
+    local = {"app": {"debug": True}, "db": {"port": 1}}
+
+    manager = ConfigManager(
+        sources=[DictSource(defaults), DictSource(override), DictSource(local)]
+    )
+    cfg = manager.load()
+
+    assert cfg.to_dict() == {
+        "app": {"debug": True, "log_level": "DEBUG"},
+        "db": {"host": "a", "port": 1},
+    }
+    assert defaults == {"app": {"debug": False}}
+    assert override == {"app": {"log_level": "DEBUG"}, "db": {"host": "a"}}
+    assert local == {"app": {"debug": True}, "db": {"port": 1}}
+
+
+def test_config_manager_revalidates_only_changed_data():
+    pytest.importorskip("jsonschema")
+
+    schema: Mapping[str, Any] = {
+        "type": "object",
+        "properties": {"port": {"type": "integer"}},
+    }
+
+    class MutableSource(DictSource):
+        def __init__(self) -> None:
+            super().__init__({})
+            self.data: dict[str, Any] = {"port": 8080}
+
+        def load(self) -> Mapping[str, Any] | None:
+            return dict(self.data)
+
+    source = MutableSource()
+    manager = ConfigManager(sources=[source], schema=schema, cache_validations=True)
+
+    first = manager.load()
+    assert manager.load() is first
+
+    source.data["port"] = "not-an-int"
+    with pytest.raises(ConfigurationError):
+        manager.load()
+
+    # Off by default
+    uncached = ConfigManager(sources=[DictSource({"port": 1})], schema=schema)
+    assert uncached.load() is not uncached.load()
+
+
+def test_validate_config_reuses_schema_between_calls():
+    pytest.importorskip("jsonschema")
+    from confman.validation import validate_config
+
+    schema: Mapping[str, Any] = {
+        "type": "object",
+        "properties": {"port": {"type": "integer"}},
+    }
+
+    validate_config({"port": 1}, schema)
+    with pytest.raises(ConfigurationError) as excinfo:
+        validate_config({"port": "x"}, schema)
+    assert "port" in str(excinfo.value)
+
+
+def test_config_manager_schema_validation_with_jsonschema_backend(monkeypatch):
+    jsonschema = pytest.importorskip("jsonschema")
+    import confman.validation as validation
+
+    monkeypatch.setattr(validation, "fastjsonschema", None)
+
+    schema: Mapping[str, Any] = {
+        "type": "object",
+        "properties": {"port": {"type": "integer"}},
+    }
+    manager = ConfigManager(sources=[DictSource({"port": 8080})], schema=schema)
+    assert manager.load().port == 8080
+
+    manager = ConfigManager(sources=[DictSource({"port": "x"})], schema=schema)
+
+    with pytest.raises(ConfigurationError) as excinfo:
+        manager.load()
+    assert "'port'" in str(excinfo.value)
+    assert isinstance(excinfo.value.__cause__, jsonschema.ValidationError)
+
+
+@pytest.mark.parametrize("fast_backend", [True, False])
+def test_validate_config_accepts_non_dict_mappings(monkeypatch, fast_backend):
+    pytest.importorskip("jsonschema")
+    from types import MappingProxyType
+
+    import confman.validation as validation
+
+    if not fast_backend:
+        monkeypatch.setattr(validation, "fastjsonschema", None)
+    elif validation.fastjsonschema is None:
+        pytest.skip("fastjsonschema is not installed")
+
+    schema = MappingProxyType(
+        {
+            "$schema": DRAFT_07,
+            "type": "object",
+            "properties": {"port": {"type": "integer"}},
+        }
+    )
+    validation.validate_config(MappingProxyType({"port": 8080}), schema)
+
+    with pytest.raises(ConfigurationError) as excinfo:
+        validation.validate_config(MappingProxyType({"port": "x"}), schema)
+    assert "port" in str(excinfo.value)
+
+
+def test_fastjsonschema_is_only_used_for_supported_drafts(monkeypatch):
+    pytest.importorskip("jsonschema")
+    import confman.validation as validation
+
+    if validation.fastjsonschema is None:
+        pytest.skip("fastjsonschema is not installed")
+
+    def fail(schema):
+        raise AssertionError("draft-07 schemas are compiled with fastjsonschema")
+
+    with monkeypatch.context() as m:
+        m.setattr(validation, "_compile_jsonschema", fail)
+        validation.compile_schema({"$schema": DRAFT_07 + "#", "required": ["a"]})
+
+    # No $schema means the latest draft, which only jsonschema implements
+    schema = {
+        "type": "object",
+        "dependentRequired": {"host": ["port"]},
+        "properties": {"hosts": {"prefixItems": [{"type": "string"}]}},
+    }
+    validation.validate_config({"host": "db", "port": 1, "hosts": ["a"]}, schema)
+    with pytest.raises(ConfigurationError):
+        validation.validate_config({"host": "db"}, schema)
+    with pytest.raises(ConfigurationError):
+        validation.validate_config({"hosts": [1]}, schema)
+
+
+@pytest.mark.parametrize("fast_backend", [True, False])
+def test_schema_format_is_not_enforced(monkeypatch, fast_backend):
+    pytest.importorskip("jsonschema")
+    import confman.validation as validation
+
+    if not fast_backend:
+        monkeypatch.setattr(validation, "fastjsonschema", None)
+
+    for declared in ({}, {"$schema": DRAFT_07}):
+        schema = {
+            **declared,
+            "type": "object",
+            "properties": {"email": {"type": "string", "format": "email"}},
+        }
+        # "format" is an annotation unless a format checker is configured
+        compiled = validation.compile_schema(schema)
+        compiled({"email": "not-an-email"})
+
+
+def test_unresolvable_ref_raises_configuration_error():
+    pytest.importorskip("jsonschema")
+
+    manager = ConfigManager(
+        sources=[DictSource({"a": 1})],
+        schema={"$ref": "#/definitions/missing"},
+    )
+    with pytest.raises(ConfigurationError):
+        manager.load()
+
+
+@pytest.mark.parametrize(
+    "properties",
+    [{"a": {"pattern": "("}}, []],
+    ids=["bad-pattern", "properties-not-object"],
+)
+def test_invalid_draft_07_schema_raises_configuration_error(properties):
+    pytest.importorskip("jsonschema")
+    from confman.validation import compile_schema
+
+    with pytest.raises(ConfigurationError):
+        compile_schema({"$schema": DRAFT_07, "properties": properties})
+
+
+def test_remote_refs_are_not_fetched(monkeypatch):
+    pytest.importorskip("jsonschema")
+    import urllib.request
+
+    from confman.validation import compile_schema
+
+    def fail(*args, **kwargs):
+        raise AssertionError("remote $ref must not be fetched")
+
+    monkeypatch.setattr(urllib.request, "urlopen", fail)
+
+    schema = {
+        "$schema": DRAFT_07,
+        "properties": {"a": {"$ref": "https://example.com/schema.json"}},
+    }
+    with pytest.raises(ConfigurationError):
+        compile_schema(schema)({"a": 1})
+
+
+def test_false_schema_rejects_everything():
+    pytest.importorskip("jsonschema")
+    from confman.validation import validate_config
+
+    with pytest.raises(ConfigurationError):
+        validate_config({"a": 1}, False)  # type: ignore[arg-type]
+
+    manager = ConfigManager(
+        sources=[DictSource({"a": 1})], schema=False  # type: ignore[arg-type]
+    )
+    with pytest.raises(ConfigurationError):
+        manager.load()
+
+
+def test_trivial_schema_skips_validation(monkeypatch):
+    import confman.validation as validation
+
+    def fail(schema):
+        raise AssertionError("trivial schemas must not be compiled")
+
+    monkeypatch.setattr(validation, "compile_schema", fail)
+
+    validation.validate_config({"a": 1}, {})
+    validation.validate_config({"a": 1}, {"type": "object", "title": "Config"})
+
+    manager = ConfigManager(sources=[DictSource({"a": 1})], schema={})
+    assert manager.load().a == 1
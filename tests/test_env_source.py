@@ -27,3 +27,62 @@ def test_env_source_reads_prefixed_variables(monkeypatch):
 
     # ensure unrelated env vars are ignored
     assert "other_prefix_should_be_ignored".lower() not in str(data).lower()
+
+
+def test_env_source_nested_key_replaces_scalar(monkeypatch):
+    for key in list(os.environ.keys()):
+        if key.startswith("MYAPP_"):
+            monkeypatch.delenv(key, raising=False)
+
+    monkeypatch.setenv("MYAPP_DB", "sqlite")
+    monkeypatch.setenv("MYAPP_DB__HOST", "localhost")
+    monkeypatch.setenv("MYAPP_DB__PORT", "5432")
+
+    data = EnvSource("MYAPP_").load() or {}
+
+    assert data == {"db": {"host": "localhost", "port": 5432}}
+
+
+def test_env_source_scalar_replaces_section(monkeypatch):
+    for key in list(os.environ.keys()):
+        if key.startswith("MYAPP_"):
+            monkeypatch.delenv(key, raising=False)
+
+    monkeypatch.setenv("MYAPP_DB__OPTS__TIMEOUT", "5")
+    monkeypatch.setenv("MYAPP_DB", "sqlite")
+    monkeypatch.setenv("MYAPP_DB__OPTS__RETRIES", "3")
+
+    data = EnvSource("MYAPP_").load() or {}
+
+    assert data == {"db": {"opts": {"retries": 3}}}
+
+
+def test_env_source_value_parsing(monkeypatch):
+    for key in list(os.environ.keys()):
+        if key.startswith("MYAPP_"):
+            monkeypatch.delenv(key, raising=False)
+
+    values = {
+        "MYAPP_FLAG_ON": ("Yes", True),
+        "MYAPP_FLAG_OFF": (" off ", False),
+        "MYAPP_COUNT": ("1", 1),
+        "MYAPP_OFFSET": ("-42", -42),
+        "MYAPP_RATIO": ("0.25", 0.25),
+        "MYAPP_SCALE": ("1e3", 1000.0),
+        "MYAPP_NAME": ("info", "info"),
+        "MYAPP_VERSION": ("1.2.3", "1.2.3"),
+        "MYAPP_HOST": ("10.0.0.1", "10.0.0.1"),
+        "MYAPP_EMPTY": ("", ""),
+        "MYAPP_WIDE": ("１２", 12),
+        "MYAPP_ARABIC": ("٣٤.٥", 34.5),
+        "MYAPP_SQUARED": ("²", "²"),
+    }
+    for key, (raw, _) in values.items():
+        monkeypatch.setenv(key, raw)
+
+    data = EnvSource("MYAPP_").load() or {}
+
+    for key, (_, expected) in values.items():
+        value = data[key[len("MYAPP_"):].lower()]
+        assert value == expected
+        assert type(value) is type(expected)
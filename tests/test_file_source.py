@@ -1,11 +1,12 @@
 from __future__ import annotations
 
 import json
+import math
 from pathlib import Path
 
 import pytest
 
-from confman import FileSource, ConfigurationError
+from confman import ConfigManager, FileSource, ConfigurationError
 
 
 def test_file_source_loads_json_file(tmp_path: Path):
@@ -49,24 +50,30 @@ def test_file_source_missing_optional_returns_empty_or_none(tmp_path: Path):
     assert loaded is None or loaded == {}
 
 
-#def test_file_source_loads_yaml_if_pyyaml_installed(tmp_path: Path):
-#    yaml = pytest.importorskip("yaml")
-#
-#    content = """
-#    app:
-#      debug: true
-#    database:
-#      host: "db.local"
-#      port: 5432
-#    """
-#    config_file = tmp_path / "config.yaml"
-#    config_file.write_text(content, encoding="utf-8")
-#
-#    source = FileSource(config_file)
-#    loaded = source.load()
-#
-#    assert loaded["app"]["debug"] is True
-#    assert loaded["database"]["host"] == "db.local"
+def test_file_source_loads_yaml_if_pyyaml_installed(tmp_path: Path):
+    yaml = pytest.importorskip("yaml")
+    import confman.sources as sources
+
+    # The LibYAML-backed loader is used whenever PyYAML was built with it
+    assert sources._YamlSafeLoader is getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+
+    content = """
+app:
+  debug: true
+database:
+  host: "db.local"
+  port: 5432
+"""
+    config_file = tmp_path / "config.yaml"
+    config_file.write_text(content, encoding="utf-8")
+
+    source = FileSource(config_file)
+    loaded = source.load()
+
+    assert loaded["app"]["debug"] is True
+    assert loaded["database"]["host"] == "db.local"
+    assert loaded["database"]["port"] == 5432
+
 
 def test_file_source_dump_json_roundtrip(tmp_path: Path) -> None:
     """dump() followed by load() should roundtrip JSON configuration data."""
@@ -218,5 +225,119 @@ def test_file_source_dump_ini_rejects_nested_structures(tmp_path: Path) -> None:
     config_file = tmp_path / "config.ini"
     source = FileSource(config_file, optional=True)
 
-    with pytest.raises(ConfigurationError):
+    with pytest.raises(ConfigurationError) as excinfo:
         source.dump(config_data)
+    # The first offending key is reported and nothing is written
+    assert "app.prints" in str(excinfo.value)
+    assert not config_file.exists()
+
+
+def test_file_source_reuses_cached_data_until_file_changes(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    config_file = tmp_path / "config.json"
+    config_file.write_text(json.dumps({"a": 1}), encoding="utf-8")
+
+    source = FileSource(config_file)
+    assert source.load() == {"a": 1}
+
+    def fail(self):
+        raise AssertionError("unchanged file must not be parsed again")
+
+    # The cache is shared between sources for the same file
+    with monkeypatch.context() as m:
+        m.setattr(FileSource, "_load_json", fail)
+        assert source.load() == {"a": 1}
+        assert FileSource(config_file).load() == {"a": 1}
+
+    FileSource(config_file).dump({"a": 22})
+    assert source.load() == {"a": 22}
+
+    uncached = FileSource(config_file, enable_cache=False)
+    assert uncached.load() == {"a": 22}
+
+
+def test_file_source_cached_data_is_not_shared_with_callers(tmp_path: Path) -> None:
+    config_file = tmp_path / "config.json"
+    config_file.write_text(
+        json.dumps({"db": {"port": 5432}, "hosts": ["a"]}), encoding="utf-8"
+    )
+
+    first = FileSource(config_file).load()
+    first["db"]["port"] = 1
+    first["hosts"].append("evil")
+
+    second = FileSource(config_file).load()
+    assert second == {"db": {"port": 5432}, "hosts": ["a"]}
+    second["hosts"].append("evil")
+
+    cfg = ConfigManager(sources=[FileSource(config_file)]).load()
+    cfg.hosts.append("x")
+    assert FileSource(config_file).load() == {"db": {"port": 5432}, "hosts": ["a"]}
+
+
+def test_file_source_json_roundtrip_without_orjson(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    """The stdlib json fallback is used when orjson is not available."""
+    import confman.sources as sources
+
+    monkeypatch.setattr(sources, "orjson", None)
+
+    config_data = {"app": {"debug": True}, "database": {"port": 5432}}
+    config_file = tmp_path / "config.json"
+
+    FileSource(config_file).dump(config_data)
+    assert FileSource(config_file).load() == config_data
+
+
+def test_file_source_loads_large_json(tmp_path: Path) -> None:
+    """Large JSON files take the memory-mapped path when orjson is installed."""
+    from confman.sources import _JSON_MMAP_THRESHOLD
+
+    config_data = {f"key{i}": {"value": i} for i in range(_JSON_MMAP_THRESHOLD // 10)}
+    config_file = tmp_path / "config.json"
+    config_file.write_text(json.dumps(config_data), encoding="utf-8")
+    assert config_file.stat().st_size >= _JSON_MMAP_THRESHOLD
+
+    assert FileSource(config_file).load() == config_data
+
+    config_file.write_text(json.dumps(config_data)[:-1], encoding="utf-8")
+    with pytest.raises(ConfigurationError):
+        FileSource(config_file).load()
+
+
+@pytest.mark.parametrize("padding", [0, 70_000], ids=["small", "mmap"])
+def test_file_source_json_keeps_values_exact(tmp_path: Path, padding: int) -> None:
+    """Values orjson cannot represent round-trip exactly, like with stdlib json."""
+    config_data = {
+        "big": 2**64,
+        "huge": -(2**70),
+        "inf": float("inf"),
+        "ninf": float("-inf"),
+        "name": "Grüße",
+        "padding": "x" * padding,
+    }
+    config_file = tmp_path / "config.json"
+
+    FileSource(config_file).dump(config_data)
+    text = config_file.read_text(encoding="utf-8")
+    assert text == json.dumps(config_data, indent=2, sort_keys=True) + "\n"
+
+    loaded = FileSource(config_file).load()
+    assert loaded == config_data
+    assert type(loaded["big"]) is int
+
+    FileSource(config_file).dump({"nan": float("nan"), "padding": "x" * padding})
+    assert math.isnan(FileSource(config_file).load()["nan"])
+
+
+def test_file_source_unsupported_extension_raises(tmp_path: Path) -> None:
+    config_file = tmp_path / "config.xml"
+    config_file.write_text("<config/>", encoding="utf-8")
+    source = FileSource(config_file)
+
+    with pytest.raises(ConfigurationError):
+        source.load()
+    with pytest.raises(ConfigurationError):
+        source.dump({"a": 1})
@@ -1,6 +1,7 @@
 from __future__ import annotations
 
 from pathlib import Path
+import os
 import stat
 
 import pytest
@@ -31,6 +32,24 @@ def test_raw_source_binary_roundtrip(tmp_path: Path) -> None:
     assert loaded == payload
 
 
+def test_raw_source_binary_dump_accepts_buffers(tmp_path: Path) -> None:
+    import array
+
+    path = tmp_path / "raw.bin"
+    src = RawSource(path, binary=True)
+
+    src.dump(bytearray(b"\x00\x01abc"))
+    assert path.read_bytes() == b"\x00\x01abc"
+
+    numbers = array.array("i", range(1000))
+    src.dump(memoryview(numbers))
+    assert path.read_bytes() == numbers.tobytes()
+
+    # Non-contiguous buffer
+    src.dump(memoryview(b"abcdef")[::2])
+    assert path.read_bytes() == b"ace"
+
+
 def test_raw_source_optional_missing_returns_none(tmp_path: Path) -> None:
     path = tmp_path / "missing.txt"
     src = RawSource(path, optional=True)
@@ -53,3 +72,31 @@ def test_raw_source_applies_file_mode(tmp_path: Path) -> None:
     src.dump("top secret")
     mode = stat.S_IMODE(path.stat().st_mode)
     assert mode == 0o600
+
+
+def test_raw_source_dump_leaves_no_temp_files(tmp_path: Path) -> None:
+    path = tmp_path / "secret.txt"
+    src = RawSource(path, optional=True, file_mode=0o600)
+
+    src.dump("first")
+    src.dump("second")
+
+    assert [p.name for p in tmp_path.iterdir()] == ["secret.txt"]
+    assert src.load() == "second"
+
+
+def test_raw_source_dump_removes_stale_temp_files(tmp_path: Path) -> None:
+    path = tmp_path / "secret.txt"
+    # Left behind by a crashed writer (no such process) and by a live one
+    stale = tmp_path / "secret.txt.tmp.999999999"
+    live = tmp_path / f"secret.txt.tmp.{os.getppid()}"
+    for leftover in (stale, live):
+        leftover.write_text("old secret")
+        os.utime(leftover, (0, 0))
+
+    RawSource(path).dump("new")
+
+    assert not stale.exists()
+    if os.name == "posix":
+        assert live.exists()
+
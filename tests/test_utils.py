@@ -1,5 +1,7 @@
 from __future__ import annotations
 
+import pytest
+
 from confman.utils import deep_merge
 
 
@@ -32,3 +34,32 @@ def test_deep_merge_nested():
         "b": 1,
         "c": 3,
     }
+
+
+def test_deep_merge_does_not_mutate_nested_inputs():
+    base = {"a": {"x": 1}}
+    override = {"a": {"y": 2}}
+
+    result = deep_merge(base, override)
+    result["a"]["z"] = 3
+
+    assert base == {"a": {"x": 1}}
+    assert override == {"a": {"y": 2}}
+
+
+def test_deep_merge_shares_untouched_subtrees():
+    base = {"big": {"x": 1}, "a": {"y": 2}}
+
+    result = deep_merge(base, {"a": {"y": 3}})
+
+    assert result["big"] is base["big"]
+    assert result["a"] == {"y": 3}
+    assert base["a"] == {"y": 2}
+
+
+def test_deep_merge_rejects_cyclic_data():
+    cyclic: dict = {"a": 1}
+    cyclic["self"] = cyclic
+
+    with pytest.raises(ValueError):
+        deep_merge(cyclic, cyclic)